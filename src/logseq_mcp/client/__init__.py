@@ -1,3 +1,6 @@
 from .logseq_client import LogseqAPIClient
 
-__all__ = ["LogseqAPIClient"]
\ No newline at end of file
+# Shared client so configuration is read once and API calls share one session
+logseq_client = LogseqAPIClient()
+
+__all__ = ["LogseqAPIClient", "logseq_client"]
\ No newline at end of file
@@ -1,5 +1,6 @@
 import requests
 import os
+import threading
 from typing import Dict, List, Optional, Any
 
 
@@ -17,6 +18,19 @@ class LogseqAPIClient:
         
         self.api_url = api_url or os.getenv("LOGSEQ_API_URL", "http://localhost:12315")
         self.token = token or os.getenv("LOGSEQ_TOKEN")
+        # requests.Session isn't documented as thread-safe and tools call the
+        # client from asyncio.to_thread workers, so each thread gets its own
+        self._local = threading.local()
+        # Seconds to wait on the Logseq server before giving up on a request
+        self.timeout = float(os.getenv("REQUEST_TIMEOUT", "30"))
+    
+    @property
+    def session(self) -> requests.Session:
+        """Get the calling thread's session, reusing its connection across API calls"""
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._local.session = requests.Session()
+        return session
     
     def _get_headers(self) -> Dict[str, str]:
         """Get headers for API requests"""
@@ -47,7 +61,7 @@ class LogseqAPIClient:
         }
         
         try:
-            response = requests.post(url, headers=headers, json=data)
+            response = self.session.post(url, headers=headers, json=data, timeout=self.timeout)
             
             if response.status_code == 401:
                 return {
@@ -155,6 +169,13 @@ class LogseqAPIClient:
             return response
         return response.get("result", []) if isinstance(response, dict) else []
     
+    def datascript_query(self, query: str) -> Any:
+        """Run a datascript query against the graph database"""
+        response = self.call_api("logseq.DB.datascriptQuery", [query])
+        if isinstance(response, dict) and "result" in response:
+            return response.get("result")
+        return response
+    
     def delete_page(self, page_name: str) -> Dict:
         """Delete a page from the graph"""
         response = self.call_api("logseq.Editor.deletePage", [page_name])
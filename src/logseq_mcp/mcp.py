@@ -1,4 +1,24 @@
+import asyncio
+import functools
+
 from mcp.server.fastmcp import FastMCP
 
 # Create a FastMCP instance that will be used in the tools modules
-mcp = FastMCP("logseq-mcp")
\ No newline at end of file
+mcp = FastMCP("logseq-mcp")
+
+
+def threaded_tool(fn):
+    """
+    Register a blocking function as an MCP tool that runs in a worker thread.
+    
+    FastMCP calls sync tools directly on the event loop, so a slow Logseq API
+    call would stall every other handler. The registered tool is an async
+    wrapper around asyncio.to_thread; the original sync function is returned
+    unchanged so it can still be imported and called directly.
+    """
+    @functools.wraps(fn)
+    async def wrapper(*args, **kwargs):
+        return await asyncio.to_thread(fn, *args, **kwargs)
+    
+    mcp.tool()(wrapper)
+    return fn
\ No newline at end of file
@@ -1,11 +1,8 @@
 from typing import Dict, List, Optional
-from ..client.logseq_client import LogseqAPIClient
-from ..mcp import mcp
+from ..client import logseq_client
+from ..mcp import threaded_tool
 
-# Initialize client with configuration
-logseq_client = LogseqAPIClient()
-
-@mcp.tool()
+@threaded_tool
 def get_page_blocks(page_name: str) -> List[Dict]:
     """
     Gets all blocks from a specific page in the Logseq graph.
@@ -24,7 +21,7 @@ def get_page_blocks(page_name: str) -> List[Dict]:
     """
     return logseq_client.get_page_blocks(page_name)
 
-@mcp.tool()
+@threaded_tool
 def get_block(block_id: str) -> Optional[Dict]:
     """
     Gets a specific block from the Logseq graph by its ID.
@@ -42,7 +39,7 @@ def get_block(block_id: str) -> Optional[Dict]:
     """
     return logseq_client.get_block(block_id)
 
-@mcp.tool()
+@threaded_tool
 def create_block(page_name: str, content: str, properties: Optional[Dict] = None) -> Dict:
     """
     Creates a new block on a page in the Logseq graph.
@@ -60,7 +57,7 @@ def create_block(page_name: str, content: str, properties: Optional[Dict] = None
     """
     return logseq_client.create_block(page_name, content, properties)
 
-@mcp.tool()
+@threaded_tool
 def insert_block(parent_block_id: str, content: str, properties: Optional[Dict] = None, before: bool = False) -> Dict:
     """
     Inserts a new block as a child of the specified parent block.
@@ -80,7 +77,7 @@ def insert_block(parent_block_id: str, content: str, properties: Optional[Dict]
     """
     return logseq_client.insert_block(parent_block_id, content, properties, before)
 
-@mcp.tool()
+@threaded_tool
 def update_block(block_id: str, content: str, properties: Optional[Dict] = None) -> Dict:
     """
     Updates an existing block in the Logseq graph.
@@ -97,7 +94,7 @@ def update_block(block_id: str, content: str, properties: Optional[Dict] = None)
     """
     return logseq_client.update_block(block_id, content, properties)
 
-@mcp.tool()
+@threaded_tool
 def move_block(block_id: str, target_block_id: str, as_child: bool = False) -> Dict:
     """
     Moves a block to a new location in the graph.
@@ -116,7 +113,7 @@ def move_block(block_id: str, target_block_id: str, as_child: bool = False) -> D
     """
     return logseq_client.move_block(block_id, target_block_id, as_child)
 
-@mcp.tool()
+@threaded_tool
 def remove_block(block_id: str) -> Dict:
     """
     Removes a block from the Logseq graph.
@@ -131,7 +128,7 @@ def remove_block(block_id: str) -> Dict:
     """
     return logseq_client.remove_block(block_id)
 
-@mcp.tool()
+@threaded_tool
 def search_blocks(query: str) -> List[Dict]:
     """
     Searches for blocks matching a query in the Logseq graph.
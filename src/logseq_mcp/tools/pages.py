@@ -1,11 +1,8 @@
 from typing import Dict, List, Optional
-from ..client.logseq_client import LogseqAPIClient
-from ..mcp import mcp
+from ..client import logseq_client
+from ..mcp import threaded_tool
 
-# Initialize client with configuration
-logseq_client = LogseqAPIClient()
-
-@mcp.tool()
+@threaded_tool
 def get_all_pages() -> List[Dict]:
     """
     Gets all pages from the Logseq graph.
@@ -18,7 +15,7 @@ def get_all_pages() -> List[Dict]:
     """
     return logseq_client.get_all_pages()
 
-@mcp.tool()
+@threaded_tool
 def get_page(name: str) -> Optional[Dict]:
     """
     Gets a specific page from the Logseq graph by name.
@@ -36,7 +33,7 @@ def get_page(name: str) -> Optional[Dict]:
     """
     return logseq_client.get_page(name)
 
-@mcp.tool()
+@threaded_tool
 def create_page(name: str, properties: Optional[Dict] = None) -> Dict:
     """
     Creates a new page in the Logseq graph.
@@ -53,7 +50,7 @@ def create_page(name: str, properties: Optional[Dict] = None) -> Dict:
     """
     return logseq_client.create_page(name, properties)
 
-@mcp.tool()
+@threaded_tool
 def delete_page(name: str) -> Dict:
     """
     Deletes a page from the Logseq graph.
@@ -68,7 +65,7 @@ def delete_page(name: str) -> Dict:
     """
     return logseq_client.delete_page(name)
 
-@mcp.tool()
+@threaded_tool
 def get_page_linked_references(page_name: str) -> List[Dict]:
     """
     Gets all linked references to a specific page.